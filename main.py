@@ -1,42 +1,284 @@
 from fastapi import FastAPI, HTTPException
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import FileResponse
+from starlette.staticfiles import NotModifiedResponse
+from fastapi.responses import FileResponse, ORJSONResponse, Response, StreamingResponse
 from pydantic import BaseModel
+from starlette.datastructures import Headers
 import os
 import time
+import hashlib
+import json
 import asyncio
+import anyio
 import httpx
+import mmap
+import orjson
+import re
+import tempfile
+import threading
+from collections import OrderedDict
 from pathlib import Path
+from typing import Dict, Optional, Tuple
 from dotenv import load_dotenv
 
 # Load environment variables
 load_dotenv()
 
-app = FastAPI()
+app = FastAPI(default_response_class=ORJSONResponse)
 
 # OpenAI API configuration
 OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
 OPENAI_API_BASE = "https://api.openai.com/v1"
 
+# Request headers for OpenAI, built once instead of on every call
+AUTH_HEADERS = {"Authorization": f"Bearer {OPENAI_API_KEY}"}
+JSON_AUTH_HEADERS = {**AUTH_HEADERS, "Content-Type": "application/json"}
+
+# Shared HTTP client for OpenAI (keeps TCP/TLS connections alive across polls and downloads)
+http_client: Optional[httpx.AsyncClient] = None
+
+# Background video jobs: queue of (video_id, cache_key), latest state per video ID,
+# and an event per video ID that is set (and replaced) whenever that state changes
+video_queue: Optional[asyncio.Queue] = None
+video_status: Dict[str, dict] = {}
+video_status_changed: Dict[str, asyncio.Event] = {}
+video_worker_task: Optional[asyncio.Task] = None
+
+# Seconds a finished video's state stays available to event streams
+VIDEO_STATUS_TTL = 3600
+
+# Seconds between keep-alive comments on an idle event stream
+SSE_KEEPALIVE_INTERVAL = 15.0
+
+# Event streams must not be cached by browsers or buffered by proxies (nginx)
+SSE_HEADERS = {"cache-control": "no-cache", "x-accel-buffering": "no"}
+
 # Video storage configuration
 VIDEOS_DIR = Path("videos")
 VIDEOS_DIR.mkdir(exist_ok=True)  # Create directory if it doesn't exist
 
+# Index of generation request hash -> video filename, to skip regenerating identical requests
+VIDEO_CACHE_INDEX = VIDEOS_DIR / "cache_index.json"
+video_cache: Dict[str, str] = {}
+video_cache_lock = threading.Lock()  # index is saved from worker threads
+
+# Read size for streaming video content (large chunks = fewer Python<->C round trips)
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+
+# Read size when serving videos to the browser
+SERVE_CHUNK_SIZE = 1024 * 1024
+
+# Names accepted by the /videos mount (also keeps the cache index and temp files private)
+VIDEO_FILENAME_PATTERN = re.compile(r"[A-Za-z0-9_-]+\.mp4")
+
+# A video file never changes once downloaded, so browsers and CDNs may cache it for good
+VIDEO_CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+# Memory maps of recently served videos, keyed by (path, mtime_ns, size)
+MAX_MAPPED_VIDEOS = 16
+video_mmaps: "OrderedDict[Tuple[str, int, int], mmap.mmap]" = OrderedDict()
+video_mmaps_lock = threading.Lock()  # maps are created from worker threads
+
+# Upper bound in seconds between two video status polls
+MAX_POLL_INTERVAL = 30.0
+
+# Flags for writing downloaded videos through an unbuffered fd (O_BINARY exists only on Windows)
+VIDEO_OPEN_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+
 class VideoRequest(BaseModel):
     prompt: str
     model: str = "sora-2"
     size: str = "720x1280"  # Vertical by default - Supported: 720x1280, 1280x720, 1024x1792, 1792x1024
     duration: int = 8  # Only 4, 8, or 12 seconds supported
 
-class VideoResponse(BaseModel):
-    video_url: str
-    status: str
+class VideoJobResponse(BaseModel):
+    id: str
+    status: str  # "queued", or "completed" when served from cache
+    stream: str  # Server-Sent Events URL with progress updates
+    video_url: Optional[str] = None  # Set once the video is ready
     message: str
 
+@app.on_event("startup")
+async def startup():
+    global http_client, video_queue, video_worker_task, video_cache
+    video_cache = load_video_cache()
+    # Set longer timeout for video operations (2 min for any single operation)
+    http_client = httpx.AsyncClient(
+        base_url=OPENAI_API_BASE,
+        timeout=httpx.Timeout(120.0, connect=30.0),
+        limits=httpx.Limits(max_connections=100, max_keepalive_connections=20, keepalive_expiry=60.0),
+        # HTTP/2: polls and the content download share one multiplexed connection
+        # and the repeated Authorization header is HPACK-compressed
+        http2=True,
+    )
+    video_queue = asyncio.Queue()
+    video_worker_task = asyncio.create_task(run_video_worker())
+
+@app.on_event("shutdown")
+async def shutdown():
+    video_worker_task.cancel()
+    await asyncio.gather(video_worker_task, return_exceptions=True)
+    await http_client.aclose()
+
+def write_all(fd: int, data: bytes) -> None:
+    """
+    Write the whole buffer to a raw file descriptor (os.write may write partially)
+    """
+    view = memoryview(data)
+    while view:
+        written = os.write(fd, view)
+        view = view[written:]
+
+def preallocate(fd: int, size: int) -> None:
+    """
+    Reserve disk space for a download up front so writes don't keep extending the file
+
+    Best effort: skipped where posix_fallocate is unavailable (e.g. Windows)
+    or unsupported by the filesystem.
+    """
+    if not hasattr(os, "posix_fallocate"):
+        return
+    try:
+        os.posix_fallocate(fd, 0, size)
+    except OSError:
+        pass
+
+def next_poll_delay(response: httpx.Response, video_data: dict, attempt: int, elapsed: float) -> float:
+    """
+    Decide how long to wait before polling the video status again
+
+    Uses the server's Retry-After header when present. Otherwise, once the
+    reported progress gives an ETA, waits about half the remaining time;
+    before that, backs off exponentially. Always between 1 and MAX_POLL_INTERVAL seconds.
+    """
+    retry_after = response.headers.get("retry-after")
+    if retry_after:
+        try:
+            return min(MAX_POLL_INTERVAL, max(1.0, float(retry_after)))
+        except ValueError:
+            pass  # HTTP-date form, fall back to our own estimate
+
+    progress = video_data.get("progress")
+    if isinstance(progress, (int, float)) and 0 < progress < 100:
+        remaining = elapsed * (100 - progress) / progress
+        return min(MAX_POLL_INTERVAL, max(1.0, remaining / 2))
+
+    return min(MAX_POLL_INTERVAL, float(2 ** attempt))
+
 @app.get("/")
 async def read_root():
     return FileResponse("index.html")
 
+async def iter_body_chunks(response: httpx.Response):
+    """
+    Yield a streamed response body in DOWNLOAD_CHUNK_SIZE pieces with as few copies as possible
+
+    Uncompressed bodies (mp4 content normally is) skip httpx's decoder and
+    re-chunker: raw network reads are packed into two alternating preallocated
+    buffers and yielded as memoryviews. A yielded buffer is refilled two chunks
+    later, so the caller must be done with it by then (the download loop
+    awaits each write before scheduling the next).
+    """
+    encoding = response.headers.get("content-encoding", "identity")
+    if encoding != "identity" or response.is_stream_consumed:
+        async for chunk in response.aiter_bytes(chunk_size=DOWNLOAD_CHUNK_SIZE):
+            yield chunk
+        return
+
+    buffers = (bytearray(DOWNLOAD_CHUNK_SIZE), bytearray(DOWNLOAD_CHUNK_SIZE))
+    current = 0
+    filled = 0
+    async for raw in response.aiter_raw():
+        raw_view = memoryview(raw)
+        while raw_view:
+            take = min(len(raw_view), DOWNLOAD_CHUNK_SIZE - filled)
+            buffers[current][filled:filled + take] = raw_view[:take]
+            filled += take
+            raw_view = raw_view[take:]
+            if filled == DOWNLOAD_CHUNK_SIZE:
+                yield memoryview(buffers[current])
+                current ^= 1
+                filled = 0
+    if filled:
+        yield memoryview(buffers[current])[:filled]
+
+async def download_video_content(video_id: str, video_data: dict) -> dict:
+    """
+    Stream a completed video's content to VIDEOS_DIR
+
+    Args:
+        video_id: The ID of the completed video
+        video_data: Video data from the status poll
+
+    Returns:
+        Video data with local_path and video_filename added
+    """
+    print(f"DEBUG - Video completed, downloading content for {video_id}")
+
+    video_filename = f"{video_id}.mp4"
+    video_path = VIDEOS_DIR / video_filename
+
+    # Stream download the video content (prevents timeout on large files)
+    async with http_client.stream(
+        "GET",
+        f"/videos/{video_id}/content",
+        headers=AUTH_HEADERS,
+        follow_redirects=True
+    ) as content_response:
+
+        if content_response.status_code == 200:
+            # Download and save video in chunks
+            # Write straight to a raw fd - chunks are already large, so
+            # Python's buffered writer would only add an extra copy.
+            # Disk writes run in the default thread pool so the event loop
+            # stays free; the next chunk is received while the previous one
+            # is being written.
+            loop = asyncio.get_running_loop()
+            total_bytes = 0
+            pending_write = None
+            expected_size = int(content_response.headers.get("content-length", 0))
+            # Download under a temporary name (not servable) and only move it into place
+            # once complete, so a failed download never shows up as a finished video
+            part_path = VIDEOS_DIR / f"{video_filename}.part"
+            fd = os.open(str(part_path), VIDEO_OPEN_FLAGS, 0o644)
+            try:
+                if expected_size:
+                    await loop.run_in_executor(None, preallocate, fd, expected_size)
+                async for chunk in iter_body_chunks(content_response):
+                    if chunk:
+                        if pending_write is not None:
+                            await pending_write
+                        pending_write = loop.run_in_executor(None, write_all, fd, chunk)
+                        total_bytes += len(chunk)
+                if pending_write is not None:
+                    await pending_write
+                    pending_write = None
+                if total_bytes < expected_size:
+                    # Body was shorter than announced, drop the preallocated tail
+                    os.ftruncate(fd, total_bytes)
+            except BaseException:
+                if pending_write is not None:
+                    # Don't close the fd under a write that is still running
+                    await asyncio.gather(pending_write, return_exceptions=True)
+                os.close(fd)
+                os.unlink(part_path)
+                raise
+            os.close(fd)
+            os.replace(part_path, video_path)
+
+            print(f"DEBUG - Video saved to {video_path} ({total_bytes} bytes)")
+
+            # Store the local file path in video_data
+            video_data["local_path"] = str(video_path)
+            video_data["video_filename"] = video_filename
+            return video_data
+        else:
+            error_text = await content_response.aread()
+            raise HTTPException(
+                status_code=content_response.status_code,
+                detail=f"Failed to download video content: {error_text.decode()}"
+            )
+
 async def wait_for_video_completion(video_id: str, max_wait: int = 600) -> dict:
     """
     Poll video status until completion or timeout
@@ -48,81 +290,181 @@ async def wait_for_video_completion(video_id: str, max_wait: int = 600) -> dict:
     Returns:
         Video data with URL when completed
     """
-    headers = {
-        "Authorization": f"Bearer {OPENAI_API_KEY}",
-    }
-
     start_time = time.time()
-    # Set longer timeout for video operations (5 min total, 2 min for any single operation)
-    timeout = httpx.Timeout(120.0, connect=30.0)
-    async with httpx.AsyncClient(timeout=timeout) as client:
-        while time.time() - start_time < max_wait:
-            # Check video status
-            response = await client.get(
-                f"{OPENAI_API_BASE}/videos/{video_id}",
-                headers=headers
+    attempt = 0
+    while time.time() - start_time < max_wait:
+        # Check video status
+        response = await http_client.get(
+            f"/videos/{video_id}",
+            headers=AUTH_HEADERS
+        )
+
+        if response.status_code != 200:
+            raise HTTPException(
+                status_code=response.status_code,
+                detail=f"Failed to check video status: {response.text}"
             )
 
-            if response.status_code != 200:
-                raise HTTPException(
-                    status_code=response.status_code,
-                    detail=f"Failed to check video status: {response.text}"
-                )
-
-            video_data = response.json()
-            status = video_data.get("status")
-
-            if status == "completed":
-                # Video is ready, now download the actual video content
-                print(f"DEBUG - Video completed, downloading content for {video_id}")
-
-                video_filename = f"{video_id}.mp4"
-                video_path = VIDEOS_DIR / video_filename
-
-                # Stream download the video content (prevents timeout on large files)
-                async with client.stream(
-                    "GET",
-                    f"{OPENAI_API_BASE}/videos/{video_id}/content",
-                    headers=headers,
-                    follow_redirects=True
-                ) as content_response:
-
-                    if content_response.status_code == 200:
-                        # Download and save video in chunks
-                        total_bytes = 0
-                        with open(video_path, "wb") as f:
-                            async for chunk in content_response.aiter_bytes(chunk_size=8192):
-                                if chunk:
-                                    f.write(chunk)
-                                    total_bytes += len(chunk)
-
-                        print(f"DEBUG - Video saved to {video_path} ({total_bytes} bytes)")
-
-                        # Store the local file path in video_data
-                        video_data["local_path"] = str(video_path)
-                        video_data["video_filename"] = video_filename
-                        return video_data
-                    else:
-                        error_text = await content_response.aread()
-                        raise HTTPException(
-                            status_code=content_response.status_code,
-                            detail=f"Failed to download video content: {error_text.decode()}"
-                        )
-
-            elif status == "failed":
-                error = video_data.get("error", {}).get("message", "Unknown error")
-                raise HTTPException(status_code=500, detail=f"Video generation failed: {error}")
-
-            # Wait before next poll (exponential backoff)
-            await asyncio.sleep(min(5, 1 + (time.time() - start_time) / 30))
+        video_data = orjson.loads(response.content)
+        status = video_data.get("status")
+
+        if status == "completed":
+            # Video is ready, now download the actual video content
+            publish_video_status(video_id, "downloading", progress=100)
+            return await download_video_content(video_id, video_data)
+
+        if status in ("queued", "in_progress"):
+            publish_video_status(video_id, status, progress=video_data.get("progress", 0))
+
+        elif status == "failed":
+            error = video_data.get("error", {}).get("message", "Unknown error")
+            raise HTTPException(status_code=500, detail=f"Video generation failed: {error}")
+
+        # Wait before next poll (server hint or adaptive backoff), never past the deadline
+        attempt += 1
+        delay = next_poll_delay(response, video_data, attempt, time.time() - start_time)
+        await asyncio.sleep(max(0.0, min(delay, max_wait - (time.time() - start_time))))
 
     raise HTTPException(status_code=408, detail="Video generation timeout")
 
+def video_cache_key(payload: dict) -> str:
+    """
+    Content-addressed key for a generation request (SHA-256 of the canonical JSON payload)
+    """
+    return hashlib.sha256(json.dumps(payload, sort_keys=True).encode()).hexdigest()
+
+def load_video_cache() -> Dict[str, str]:
+    """
+    Load the request-hash -> video filename index, or start empty if missing/corrupt
+    """
+    try:
+        with open(VIDEO_CACHE_INDEX, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+def save_video_cache(cache: Dict[str, str]) -> None:
+    """
+    Atomically write the request-hash -> video filename index
 
-@app.post("/api/generate-video", response_model=VideoResponse)
+    Entries already on disk are kept. Saves are serialized and each writes
+    its own temp file, so concurrent jobs can't replace or lose each other's writes.
+    """
+    with video_cache_lock:
+        cache = {**load_video_cache(), **cache}
+        with tempfile.NamedTemporaryFile(
+            "w", encoding="utf-8", dir=VIDEOS_DIR, suffix=".tmp", delete=False
+        ) as f:
+            json.dump(cache, f)
+        try:
+            os.replace(f.name, VIDEO_CACHE_INDEX)
+        except OSError:
+            os.unlink(f.name)
+            raise
+
+def publish_video_status(video_id: str, status: str, **details) -> None:
+    """
+    Record a video's latest state and wake up everyone streaming its events
+    """
+    video_status[video_id] = {"id": video_id, "status": status, **details}
+    changed = video_status_changed.pop(video_id, None)
+    if changed is not None:
+        changed.set()
+    if status in ("completed", "failed"):
+        # Keep finished states around for late subscribers, but not forever
+        asyncio.get_running_loop().call_later(VIDEO_STATUS_TTL, forget_video_status, video_id)
+
+def forget_video_status(video_id: str) -> None:
+    """
+    Drop a finished video's state, unless a newer job for the same ID is running
+    """
+    if video_status.get(video_id, {}).get("status") in ("completed", "failed"):
+        video_status.pop(video_id, None)
+        # Finished streams leave their last wake-up event behind
+        video_status_changed.pop(video_id, None)
+
+async def run_video_job(video_id: str, cache_key: str) -> None:
+    """
+    Poll and download one video, publishing its progress and final state
+    """
+    try:
+        completed_video = await wait_for_video_completion(video_id)
+        video_filename = completed_video["video_filename"]
+
+        # Remember which file this request produced
+        video_cache[cache_key] = video_filename
+        try:
+            await asyncio.get_running_loop().run_in_executor(None, save_video_cache, dict(video_cache))
+        except OSError as e:
+            # The video itself is fine; only the on-disk cache index is stale
+            print(f"DEBUG - Failed to save video cache index: {e}")
+
+        publish_video_status(video_id, "completed", progress=100, video_url=f"/videos/{video_filename}")
+    except HTTPException as e:
+        publish_video_status(video_id, "failed", error=e.detail)
+    except Exception as e:
+        publish_video_status(video_id, "failed", error=f"Error generating video: {e}")
+
+async def run_video_worker() -> None:
+    """
+    Take queued videos and run each one as its own task, so many videos
+    can be polled and downloaded concurrently over the shared client
+    """
+    running = set()
+    try:
+        while True:
+            video_id, cache_key = await video_queue.get()
+            task = asyncio.create_task(run_video_job(video_id, cache_key))
+            running.add(task)
+            task.add_done_callback(running.discard)
+    finally:
+        for task in running:
+            task.cancel()
+        await asyncio.gather(*running, return_exceptions=True)
+
+def track_video(video_id: str, cache_key: str) -> None:
+    """
+    Queue a video for polling and download unless it is already tracked
+
+    Concurrent requests for the same video ID share one poll/download job.
+    """
+    if video_status.get(video_id, {}).get("status") not in (None, "failed"):
+        return
+    publish_video_status(video_id, "queued", progress=0)
+    video_queue.put_nowait((video_id, cache_key))
+
+def format_event(event: str, data: dict) -> bytes:
+    """
+    Encode one Server-Sent Event
+    """
+    return b"event: " + event.encode() + b"\ndata: " + orjson.dumps(data) + b"\n\n"
+
+async def iter_video_events(video_id: str):
+    """
+    Yield SSE "status" events for a video until it completes or fails
+    """
+    while True:
+        # Grab the wake-up event before reading the state so no update is missed
+        changed = video_status_changed.setdefault(video_id, asyncio.Event())
+        state = video_status[video_id]
+        yield format_event("status", state)
+        if state["status"] in ("completed", "failed"):
+            return
+
+        while not changed.is_set():
+            try:
+                await asyncio.wait_for(changed.wait(), timeout=SSE_KEEPALIVE_INTERVAL)
+            except asyncio.TimeoutError:
+                # Comment line keeps proxies from closing an idle stream
+                yield b": keep-alive\n\n"
+
+@app.post("/api/generate-video", response_model=VideoJobResponse)
 async def generate_video(request: VideoRequest):
     """
-    Generate video using OpenAI's Video API (Sora)
+    Start generating a video using OpenAI's Video API (Sora)
+
+    Returns right away; progress and the final video URL are streamed from
+    the returned events URL while a background job polls and downloads.
     """
     try:
         # Check if API key is set
@@ -132,11 +474,6 @@ async def generate_video(request: VideoRequest):
                 detail="OPENAI_API_KEY not configured. Please set it in .env file"
             )
 
-        headers = {
-            "Authorization": f"Bearer {OPENAI_API_KEY}",
-            "Content-Type": "application/json",
-        }
-
         # Prepare JSON payload for video generation
         payload = {
             "model": request.model,
@@ -148,55 +485,53 @@ async def generate_video(request: VideoRequest):
         if request.duration:
             payload["seconds"] = str(request.duration)
 
-        # Create video generation request
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.post(
-                f"{OPENAI_API_BASE}/videos",
-                headers=headers,
-                json=payload
+        # Identical requests reuse the video already generated for them
+        cache_key = video_cache_key(payload)
+        cached_filename = video_cache.get(cache_key)
+        if cached_filename and await anyio.to_thread.run_sync((VIDEOS_DIR / cached_filename).is_file):
+            video_id = Path(cached_filename).stem
+            return VideoJobResponse(
+                id=video_id,
+                status="completed",
+                stream=f"/api/videos/{video_id}/events",
+                video_url=f"/videos/{cached_filename}",
+                message="Video loaded from cache"
             )
 
-            if response.status_code not in [200, 201]:
-                error_detail = response.text
-                try:
-                    error_json = response.json()
-                    error_detail = error_json.get("error", {}).get("message", error_detail)
-                except:
-                    pass
-                raise HTTPException(
-                    status_code=response.status_code,
-                    detail=f"Failed to create video: {error_detail}"
-                )
-
-            video_data = response.json()
-            video_id = video_data.get("id")
-
-            if not video_id:
-                raise HTTPException(status_code=500, detail="No video ID returned")
-
-        # Wait for video to complete and download it
-        completed_video = await wait_for_video_completion(video_id)
-
-        # Debug: Print the response to understand structure
-        print(f"DEBUG - Completed video response keys: {completed_video.keys()}")
-
-        # Get video filename (should be added by wait_for_video_completion)
-        video_filename = completed_video.get("video_filename")
+        # Create video generation request
+        response = await http_client.post(
+            "/videos",
+            headers=JSON_AUTH_HEADERS,
+            content=orjson.dumps(payload),
+            timeout=30.0
+        )
 
-        if not video_filename:
-            # If still not found, return the whole response for debugging
+        if response.status_code not in [200, 201]:
+            error_detail = response.text
+            try:
+                error_json = orjson.loads(response.content)
+                error_detail = error_json.get("error", {}).get("message", error_detail)
+            except:
+                pass
             raise HTTPException(
-                status_code=500,
-                detail=f"No video file found. Response: {str(completed_video)[:500]}"
+                status_code=response.status_code,
+                detail=f"Failed to create video: {error_detail}"
             )
 
-        # Return local URL that points to our server
-        local_video_url = f"/videos/{video_filename}"
+        video_data = orjson.loads(response.content)
+        video_id = video_data.get("id")
+
+        if not video_id:
+            raise HTTPException(status_code=500, detail="No video ID returned")
+
+        # Poll and download in the background
+        track_video(video_id, cache_key)
 
-        return VideoResponse(
-            video_url=local_video_url,
-            status="success",
-            message="Video generated successfully"
+        return VideoJobResponse(
+            id=video_id,
+            status="queued",
+            stream=f"/api/videos/{video_id}/events",
+            message="Video generation started"
         )
 
     except HTTPException:
@@ -205,6 +540,32 @@ async def generate_video(request: VideoRequest):
         error_message = str(e)
         raise HTTPException(status_code=500, detail=f"Error generating video: {error_message}")
 
+@app.get("/api/videos/{video_id}/events")
+async def video_events(video_id: str):
+    """
+    Stream a video's progress as Server-Sent Events ("status" events)
+    """
+    if video_id not in video_status:
+        # Not tracked (e.g. served from cache or finished long ago): report it done if the file exists
+        video_filename = f"{video_id}.mp4"
+        exists = VIDEO_FILENAME_PATTERN.fullmatch(video_filename) and await anyio.to_thread.run_sync(
+            (VIDEOS_DIR / video_filename).is_file
+        )
+        if not exists:
+            raise HTTPException(status_code=404, detail="Video not found")
+        state = {"id": video_id, "status": "completed", "progress": 100, "video_url": f"/videos/{video_filename}"}
+        return StreamingResponse(
+            iter([format_event("status", state)]),
+            media_type="text/event-stream",
+            headers=SSE_HEADERS
+        )
+
+    return StreamingResponse(
+        iter_video_events(video_id),
+        media_type="text/event-stream",
+        headers=SSE_HEADERS
+    )
+
 @app.get("/api/health")
 async def health_check():
     """
@@ -216,24 +577,151 @@ async def health_check():
         "api_key_configured": api_key_configured
     }
 
-@app.get("/videos/{video_filename}")
-async def serve_video(video_filename: str):
+def parse_range(range_header: str, file_size: int) -> Optional[Tuple[int, int]]:
+    """
+    Parse a single-range "Range: bytes=..." header
+
+    Returns:
+        Inclusive (start, end) byte offsets, or None if the header should be
+        ignored (invalid, not a byte range, or several ranges) and the full file sent
+
+    Raises:
+        ValueError: If the range is valid but cannot be satisfied for this file
     """
-    Serve downloaded video files
+    unit, _, spec = range_header.partition("=")
+    if unit.strip().lower() != "bytes" or "," in spec:
+        return None
+
+    start_text, _, end_text = spec.strip().partition("-")
+    if not all(text.isdigit() for text in (start_text, end_text) if text) or not (start_text or end_text):
+        # Invalid syntax: RFC 9110 says to ignore the header
+        return None
+
+    if not start_text:
+        # Suffix range: the last N bytes
+        suffix = int(end_text)
+        if suffix == 0 or file_size == 0:
+            raise ValueError(f"Range not satisfiable: {range_header}")
+        return max(0, file_size - suffix), file_size - 1
+
+    start = int(start_text)
+    if end_text and int(end_text) < start:
+        # last-pos before first-pos makes the range invalid, not unsatisfiable
+        return None
+    if start >= file_size:
+        raise ValueError(f"Range not satisfiable: {range_header}")
+    end = int(end_text) if end_text else file_size - 1
+    return start, min(end, file_size - 1)
+
+def get_video_mmap(path: str, stat_result: os.stat_result) -> mmap.mmap:
     """
-    video_path = VIDEOS_DIR / video_filename
+    Return a read-only memory map of a video, reusing cached mappings (LRU)
 
-    # Check if file exists
-    if not video_path.exists():
-        raise HTTPException(status_code=404, detail="Video not found")
+    Repeated views of the same video are served from the kernel page cache
+    without read() syscalls. Evicted maps are not closed explicitly: they are
+    unmapped once the last in-flight response streaming from them finishes.
+    """
+    key = (path, stat_result.st_mtime_ns, stat_result.st_size)
+    with video_mmaps_lock:
+        mapped = video_mmaps.get(key)
+        if mapped is not None:
+            video_mmaps.move_to_end(key)
+            return mapped
+
+        with open(path, "rb") as f:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        video_mmaps[key] = mapped
+        while len(video_mmaps) > MAX_MAPPED_VIDEOS:
+            video_mmaps.popitem(last=False)
+        return mapped
+
+async def iter_mapped_range(path: str, stat_result: os.stat_result, start: int, end: int):
+    """
+    Yield the bytes between start and end (inclusive) of a video file in chunks
+    """
+    # Opening and mapping are blocking syscalls, so they run in a worker thread too
+    mapped = await anyio.to_thread.run_sync(get_video_mmap, path, stat_result)
+    position = start
+    while position <= end:
+        chunk_end = min(position + SERVE_CHUNK_SIZE, end + 1)
+        # Slicing may fault pages in from disk, so keep it off the event loop
+        yield await anyio.to_thread.run_sync(mapped.__getitem__, slice(position, chunk_end))
+        position = chunk_end
+
+class VideoFileResponse(FileResponse):
+    """
+    FileResponse that reads in 1 MiB chunks instead of Starlette's 64 KiB
+    and sends a proper quoted (strong) ETag
+    """
+    chunk_size = SERVE_CHUNK_SIZE
 
-    # Serve the video file
-    return FileResponse(
-        path=str(video_path),
-        media_type="video/mp4",
-        filename=video_filename
-    )
+    def set_stat_headers(self, stat_result: os.stat_result) -> None:
+        super().set_stat_headers(stat_result)
+        self.headers["etag"] = f'"{stat_result.st_mtime_ns:x}-{stat_result.st_size:x}"'
+
+class VideoFiles(StaticFiles):
+    """
+    StaticFiles with HTTP Range support, so players can seek without re-downloading the video
+    """
+
+    async def get_response(self, path: str, scope) -> Response:
+        # Only plain "<video_id>.mp4" names are served; anything else is rejected before touching disk
+        if not VIDEO_FILENAME_PATTERN.fullmatch(path):
+            raise HTTPException(status_code=404, detail="Video not found")
+        return await super().get_response(path, scope)
+
+    def file_response(self, full_path, stat_result, scope, status_code=200) -> Response:
+        request_headers = Headers(scope=scope)
+        response = VideoFileResponse(
+            full_path,
+            status_code=status_code,
+            headers={"cache-control": VIDEO_CACHE_CONTROL},
+            stat_result=stat_result,
+            method=scope["method"]
+        )
+        if self.is_not_modified(response.headers, request_headers):
+            return NotModifiedResponse(response.headers)
+        if response.status_code != 200:
+            return response
+        response.headers["accept-ranges"] = "bytes"
+
+        range_header = request_headers.get("range")
+        if_range = request_headers.get("if-range")
+        if not range_header or (if_range and if_range != response.headers["etag"]):
+            return response
+
+        file_size = stat_result.st_size
+        try:
+            byte_range = parse_range(range_header, file_size)
+        except ValueError:
+            return Response(status_code=416, headers={"content-range": f"bytes */{file_size}"})
+        if byte_range is None:
+            return response
+
+        start, end = byte_range
+        headers = {
+            "content-range": f"bytes {start}-{end}/{file_size}",
+            "content-length": str(end - start + 1),
+            "accept-ranges": "bytes",
+            "etag": response.headers["etag"],
+            "last-modified": response.headers["last-modified"],
+            "cache-control": VIDEO_CACHE_CONTROL,
+        }
+        media_type = response.headers["content-type"]
+        if scope["method"] == "HEAD":
+            return Response(status_code=206, headers=headers, media_type=media_type)
+        return StreamingResponse(
+            iter_mapped_range(str(full_path), stat_result, start, end),
+            status_code=206,
+            headers=headers,
+            media_type=media_type
+        )
+
+# Serve downloaded video files (Starlette static serving: stat off the event loop, ETag/304 handling)
+app.mount("/videos", VideoFiles(directory=str(VIDEOS_DIR)), name="videos")
 
 if __name__ == "__main__":
     import uvicorn
+    # uvloop and httptools are used automatically when installed (uvicorn[standard]).
+    # Always a single worker: video jobs and their event streams live in process memory.
     uvicorn.run(app, host="127.0.0.1", port=8000)
@@ -2,11 +2,13 @@
 """
 Test script to generate a video using the SoraGen API
 """
+import json
 import requests
 import time
 
 # API endpoint
-API_URL = "http://127.0.0.1:8000/api/generate-video"
+BASE_URL = "http://127.0.0.1:8000"
+API_URL = f"{BASE_URL}/api/generate-video"
 
 # Test prompt - simple and short
 prompt = "A cute cat sitting on a table, looking at the camera, realistic home video"
@@ -29,19 +31,41 @@ print("\n⏳ Sending request to API (this may take 1-3 minutes)...\n")
 start_time = time.time()
 
 try:
-    response = requests.post(API_URL, json=payload, timeout=600)
+    response = requests.post(API_URL, json=payload, timeout=60)
+
+    if response.status_code != 200:
+        print(f"❌ Error {response.status_code}")
+        print(f"📄 Response: {response.text}")
+        raise SystemExit(1)
+
+    data = response.json()
+    video_url = data.get("video_url")
+
+    # Not cached: follow the progress event stream until the video is ready
+    if not video_url:
+        print(f"🆔 Video ID: {data['id']}")
+        with requests.get(f"{BASE_URL}{data['stream']}", stream=True, timeout=600) as events:
+            for line in events.iter_lines(decode_unicode=True):
+                if not line or not line.startswith("data: "):
+                    continue
+                state = json.loads(line[len("data: "):])
+                if state["status"] == "completed":
+                    video_url = state["video_url"]
+                    break
+                if state["status"] == "failed":
+                    print(f"❌ Error: {state.get('error')}")
+                    raise SystemExit(1)
+                print(f"   ... {state['status']} {state.get('progress', 0)}%")
 
     elapsed = time.time() - start_time
 
-    if response.status_code == 200:
-        data = response.json()
+    if video_url:
         print(f"✅ Success! Video generated in {elapsed:.1f} seconds")
-        print(f"🎥 Video URL: http://127.0.0.1:8000{data['video_url']}")
-        print(f"💾 You can view the video at: http://127.0.0.1:8000")
-        print(f"📂 Local file: videos/{data['video_url'].split('/')[-1]}")
+        print(f"🎥 Video URL: {BASE_URL}{video_url}")
+        print(f"💾 You can view the video at: {BASE_URL}")
+        print(f"📂 Local file: videos/{video_url.split('/')[-1]}")
     else:
-        print(f"❌ Error {response.status_code}")
-        print(f"📄 Response: {response.text}")
+        print("❌ Event stream ended before the video was ready")
 
 except requests.exceptions.Timeout:
     print("⏱️  Request timeout - video generation took too long")